@@ -6,18 +6,29 @@ based on technology specifications.
 
 from __future__ import annotations as _annotations
 
+import asyncio
 import atexit
+import functools
+import hashlib
+import os
 
 from ddgs import DDGS
 from pydantic_ai import Agent, RunContext
 from pydantic_ai.common_tools.duckduckgo import duckduckgo_search_tool
 
-from config import DEFAULT_MODEL
+from config import (
+    CACHE_DIR,
+    DEFAULT_MODEL,
+    FIX_MODEL,
+    GENERATE_MODEL,
+    VALIDATOR_MODEL,
+)
 from models import (
     AgentAction,
     RouterRequest,
     RouterResponse,
     SuccessfulBlueprint,
+    TechDeps,
     Technology,
     BlueprintStatus,
 )
@@ -31,31 +42,71 @@ from tools import (
     system_prompt,
     technology_stack,
 )
-from utils import setup_logger
+from utils import JsonFileCache, setup_logger
 
 # Configure logging
 logger = setup_logger(__name__)
 
+# Cache of successful router responses, persisted across CLI invocations so
+# repeated requests for the same technology skip the LLM roundtrip entirely.
+_router_cache = JsonFileCache(os.path.join(CACHE_DIR, "router_cache.json"))
+
+# Successful validations keyed by sha256 of the run.sh content, so validating
+# a byte-identical script a second time never reaches the validator agent.
+_validation_cache = JsonFileCache(os.path.join(CACHE_DIR, "validation_cache.json"))
+
+
+def _run_sh_digest(technology: Technology) -> str | None:
+    """Return the sha256 hex digest of the technology's run.sh, if readable."""
+    try:
+        return hashlib.sha256(technology.run_sh_path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+# Prompt components are static for the lifetime of the process; evaluate them
+# once at import so no agent run re-reads examples/run.sh or rebuilds strings.
+_SYSTEM_PROMPT = system_prompt()
+_EXAMPLE_RUN_SH = example_for_run_sh()
+_INSTRUCTIONS = instructions()
+
+
+def _cache_key(request: RouterRequest) -> str:
+    """Build the cache key for a router request."""
+    return "|".join(
+        (
+            request.action.value,
+            request.technology.language,
+            request.technology.version,
+            request.technology.package_manager,
+            request.context or "",
+        )
+    )
+
 
+@functools.lru_cache(maxsize=1)
 def create_ddgs_client():
-    """Create a DuckDuckGo search client with automatic cleanup.
+    """Create the shared DuckDuckGo search client with automatic cleanup.
+
+    The client is memoized so both agents reuse one HTTP session and its warm
+    keep-alive connections instead of paying TCP/TLS setup per agent.
 
     Returns:
-        DDGS: A configured DuckDuckGo search client instance.
+        DDGS: The shared DuckDuckGo search client instance.
     """
     client = DDGS()
-    # Register cleanup function
+    # Register cleanup function (once, since the client is a singleton)
     atexit.register(lambda: client.close() if hasattr(client, "close") else None)
     return client
 
 
 # Blueprint Agent - Responsible for generating run.sh scripts
 blueprint_agent = Agent(
-    DEFAULT_MODEL,
-    deps_type=Technology,
+    GENERATE_MODEL,
+    deps_type=TechDeps,
     output_type=SuccessfulBlueprint,
-    system_prompt=[system_prompt(), example_for_run_sh()],
-    instructions=[instructions()],
+    system_prompt=[_SYSTEM_PROMPT, _EXAMPLE_RUN_SH],
+    instructions=[_INSTRUCTIONS],
     tools=[
         duckduckgo_search_tool(create_ddgs_client()),
         create_directory,
@@ -68,8 +119,8 @@ blueprint_agent = Agent(
 
 # Validator Agent - Responsible for validating and fixing run.sh scripts
 validator_agent = Agent(
-    DEFAULT_MODEL,
-    deps_type=Technology,
+    VALIDATOR_MODEL,
+    deps_type=TechDeps,
     output_type=SuccessfulBlueprint,
     system_prompt=(
         "You are an expert DevOps engineer specializing in troubleshooting and fixing "
@@ -98,10 +149,121 @@ validator_agent = Agent(
 )
 
 
+# Warm-up Agent - tool-less twin of the validator used only to heat the model
+# provider's HTTP client ahead of validation. It has no tools and takes no
+# deps, so a warm-up run can never write run.sh, populate the validation
+# caches, or memoize tool results into an in-flight generation's deps.
+validator_warmup_agent = Agent(
+    VALIDATOR_MODEL,
+    system_prompt="You are a readiness probe. Reply with the single word: ready",
+)
+
+
+# Batch Blueprint Agent - Generates blueprints for several technologies in one call,
+# amortizing the system prompt and example tokens across all inputs.
+blueprint_batch_agent = Agent(
+    DEFAULT_MODEL,
+    output_type=list[SuccessfulBlueprint],
+    system_prompt=[
+        _SYSTEM_PROMPT,
+        _EXAMPLE_RUN_SH,
+        "Produce one blueprint per input technology, in the same order as the inputs.",
+    ],
+    instructions=[_INSTRUCTIONS],
+)
+
+
+async def _validate_blueprint(deps: TechDeps) -> RouterResponse:
+    """Validate the generated run.sh for a technology using the validator agent.
+
+    Args:
+        deps: Agent dependencies carrying the technology to validate.
+
+    Returns:
+        Router response with the validation result.
+    """
+    technology = deps.technology
+
+    # Identical scripts validate identically; serve repeats from the cache
+    script_hash = _run_sh_digest(technology)
+    if script_hash is not None:
+        cached = _validation_cache.get(script_hash)
+        if cached is not None:
+            logger.info("Validation cache hit for %s", technology.run_sh_path)
+            return RouterResponse.model_validate_json(cached)
+
+    # Stream the response so output is consumed as the model produces it
+    # instead of waiting for the final token before any processing starts.
+    async with validator_agent.run_stream(
+        f"Validate the run.sh file for the given technology stack "
+        f"{technology.language} {technology.version} {technology.package_manager}",
+        deps=deps,
+    ) as stream:
+        output = await stream.get_output()
+
+    if not output.success:
+        # If validation failed, set next action to fix
+        return RouterResponse(
+            status=BlueprintStatus.FAILURE,
+            result=output,
+            next_action=AgentAction.FIX,
+        )
+
+    # If validation succeeded, we're done; remember the outcome for the
+    # script as it exists now (the validator may have rewritten it mid-run)
+    response = RouterResponse(
+        status=BlueprintStatus.SUCCESS,
+        result=output,
+    )
+    final_hash = _run_sh_digest(technology)
+    if final_hash is not None:
+        _validation_cache.set(final_hash, response.model_dump_json())
+    return response
+
+
 # Router Agent - Orchestrates the workflow between blueprint and validator agents
-async def router_agent(request: RouterRequest) -> RouterResponse:
+async def router_agent(request: RouterRequest, use_cache: bool = True) -> RouterResponse:
     """Router agent that orchestrates the workflow between blueprint and validator agents.
 
+    Successful responses are cached on disk keyed by action, technology, and
+    context, so a repeated request returns without any agent roundtrip. A hit
+    is only served if the run.sh it refers to still exists on disk; otherwise
+    the stale entry is invalidated and the request is processed normally.
+
+    Args:
+        request: Router request containing action and technology details.
+        use_cache: Whether to consult and populate the response cache.
+
+    Returns:
+        Router response with results and next action.
+    """
+    key = _cache_key(request)
+
+    if use_cache:
+        cached = _router_cache.get(key)
+        if cached is not None:
+            if request.technology.run_sh_path.exists():
+                logger.info("Cache hit for %s", key)
+                return RouterResponse.model_validate_json(cached)
+            # The cached response refers to a run.sh that no longer exists
+            _router_cache.delete(key)
+
+    response = await _route(request)
+
+    if use_cache and response.status == BlueprintStatus.SUCCESS:
+        _router_cache.set(key, response.model_dump_json())
+
+    return response
+
+
+async def _route(request: RouterRequest) -> RouterResponse:
+    """Dispatch a router request to the appropriate agent.
+
+    The GENERATE action pipelines straight into validation: the blueprint agent
+    runs concurrently with a validator warm-up request, and on success the
+    validator is awaited immediately instead of returning to the caller's loop
+    for a second cold roundtrip.
+
     Args:
         request: Router request containing action and technology details.
 
@@ -116,69 +278,67 @@ async def router_agent(request: RouterRequest) -> RouterResponse:
         request.technology.package_manager,
     )
 
+    # One deps container per router request, so tool results memoized during
+    # generation are still warm for the follow-up validation.
+    deps = TechDeps(technology=request.technology)
+
     if request.action == AgentAction.GENERATE:
-        # Generate blueprint using blueprint agent
-        result = await blueprint_agent.run(
-            "Create a setup for the given technology stack that works on both Alpine and Debian",
-            deps=request.technology,
+        # Generate the blueprint while speculatively warming up the validator
+        # in parallel, so the follow-up validation reuses a hot client instead
+        # of paying a second cold roundtrip.
+        gen_task = asyncio.create_task(
+            blueprint_agent.run(
+                "Create a setup for the given technology stack that works on both Alpine and Debian",
+                deps=deps,
+            )
         )
+        warm_task = asyncio.create_task(validator_warmup_agent.run("preflight"))
+
+        try:
+            gen_result = await gen_task
+        finally:
+            # The warm-up has served its purpose (hot connections) once
+            # generation resolves; cancel it rather than paying for the rest
+            # of its roundtrip.
+            if not warm_task.done():
+                warm_task.cancel()
 
-        if not result.output.success:
+        if not gen_result.output.success:
             # If generation failed, set next action to fix
             return RouterResponse(
                 status=BlueprintStatus.FAILURE,
-                result=result.output,
+                result=gen_result.output,
                 next_action=AgentAction.FIX,
             )
 
-        # If generation succeeded, set next action to validate
-        return RouterResponse(
-            status=BlueprintStatus.SUCCESS,
-            result=result.output,
-            next_action=AgentAction.VALIDATE,
-        )
+        # If generation succeeded, validate immediately with the warm validator
+        return await _validate_blueprint(deps)
 
     elif request.action == AgentAction.VALIDATE:
-        tech = request.technology
         # Validate blueprint using validator agent
-        result = await validator_agent.run(
-            f"Validate the run.sh file for the given technology stack {tech.language} {tech.version} {tech.package_manager}",
-            deps=request.technology,
-        )
-
-        if not result.output.success:
-            # If validation failed, set next action to fix
-            return RouterResponse(
-                status=BlueprintStatus.FAILURE,
-                result=result.output,
-                next_action=AgentAction.FIX,
-            )
-
-        # If validation succeeded, we're done
-        return RouterResponse(
-            status=BlueprintStatus.SUCCESS,
-            result=result.output,
-        )
+        return await _validate_blueprint(deps)
 
     elif request.action == AgentAction.FIX:
         # Fix blueprint using validator agent
         context = request.context or "Fix the run.sh file that failed validation"
-        result = await validator_agent.run(
+        async with validator_agent.run_stream(
             f"{context}",
-            deps=request.technology,
-        )
+            deps=deps,
+            model=FIX_MODEL,
+        ) as stream:
+            output = await stream.get_output()
 
-        if not result.output.success:
+        if not output.success:
             # If fixing failed, we're done (with failure)
             return RouterResponse(
                 status=BlueprintStatus.FAILURE,
-                result=result.output,
+                result=output,
             )
 
         # If fixing succeeded, set next action to validate
         return RouterResponse(
             status=BlueprintStatus.SUCCESS,
-            result=result.output,
+            result=output,
             next_action=AgentAction.VALIDATE,
         )
 
@@ -3,6 +3,7 @@
 This module contains configuration settings for logging, models, and other application parameters.
 """
 
+import functools
 import logging
 import os
 from dataclasses import dataclass
@@ -10,40 +11,63 @@ from typing import Dict, Any
 
 # Model configuration
 DEFAULT_MODEL = "google-gla:gemini-2.5-flash"
+# Per-action models: generation is a simple structured step and can use the
+# cheap/fast tier; heavier reasoning is reserved for validation and fixing.
+GENERATE_MODEL = "google-gla:gemini-2.5-flash-lite"
+VALIDATOR_MODEL = "google-gla:gemini-2.5-flash"
+FIX_MODEL = "google-gla:gemini-2.5-pro"
 
 # Docker configuration
+VALIDATOR_IMAGE = "blueprint-validator:latest"
+VALIDATOR_DOCKERFILE_DIR = "docker"
+
+# The validator pool supplies the container's command (a long-lived sleep)
+# when it starts it, so only image and host settings live here.
 DOCKER_CONFIG = {
-    "image": "alpine:latest",
-    "command": "sleep 300",  # Keep container alive for 5 minutes
-    "detach": True,
+    "image": VALIDATOR_IMAGE,
     "remove": True,
     "mem_limit": "512m",
 }
 
+# Retry configuration
+SPECULATIVE_DELAY = 30.0  # Seconds before firing a second speculative attempt
+BACKOFF_BASE = 0.1  # Base for jittered exponential backoff between attempts
+
 # Logging configuration
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 LOG_LEVEL = logging.INFO
 
+# The log format uses none of the process/thread fields, so skip collecting
+# them on every record.
+logging.logProcesses = False
+logging.logThreads = False
+logging.logMultiprocessing = False
+
 # File paths
 EXAMPLES_DIR = "examples"
 SETUP_DIR = "setup"
+CACHE_DIR = ".agent_cache"
 
 
-@dataclass
+# Frozen so instances are hashable and the path helpers can be lru_cached.
+@dataclass(frozen=True)
 class BlueprintConfig:
     """Configuration for blueprint generation."""
 
     author: str = "Blueprint Generator"
     version: str = "1.0.0"
 
+    @functools.lru_cache(maxsize=256)
     def get_blueprint_path(self, language: str, version: str, package_manager: str) -> str:
         """Get the path to the blueprint file."""
-        return os.path.join(SETUP_DIR, f"{language}-{version}-{package_manager}", "blueprint.yml")
+        return os.path.join(self.get_tech_dir(language, version, package_manager), "blueprint.yml")
 
+    @functools.lru_cache(maxsize=256)
     def get_run_sh_path(self, language: str, version: str, package_manager: str) -> str:
         """Get the path to the run.sh file."""
-        return os.path.join(SETUP_DIR, f"{language}-{version}-{package_manager}", "run.sh")
+        return os.path.join(self.get_tech_dir(language, version, package_manager), "run.sh")
 
+    @functools.lru_cache(maxsize=256)
     def get_tech_dir(self, language: str, version: str, package_manager: str) -> str:
         """Get the directory for the technology."""
         return os.path.join(SETUP_DIR, f"{language}-{version}-{package_manager}")
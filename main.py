@@ -9,21 +9,70 @@ from __future__ import annotations as _annotations
 
 import argparse
 import asyncio
+import random
 import sys
 from typing import List, Optional
 
-from pydantic_ai.exceptions import UnexpectedModelBehavior
+try:
+    # uvloop substantially speeds up the I/O-heavy agent pipeline; fall back
+    # to the default loop where it is unavailable (e.g. Windows).
+    import uvloop
 
-from agents import router_agent
-from models import AgentAction, RouterRequest, Technology
+    uvloop.install()
+except ImportError:
+    pass
+
+from config import BACKOFF_BASE, SPECULATIVE_DELAY
 from utils import setup_logger
 
+# pydantic-ai and the agent modules cost hundreds of milliseconds to import;
+# they are pulled in lazily inside the functions below so --help and argument
+# errors never pay for them.
+
 # Configure logging
 logger = setup_logger(__name__)
 
 
+async def _dispatch_with_speculation(
+    request: RouterRequest, use_cache: bool, speculative_delay: float = SPECULATIVE_DELAY
+) -> RouterResponse:
+    """Dispatch a router request, racing a speculative duplicate if it is slow.
+
+    The first attempt runs alone for speculative_delay seconds. If it has not
+    completed by then, an identical attempt is fired and the first response to
+    arrive wins; the loser is cancelled. At most two attempts are in flight.
+
+    Args:
+        request: Router request to dispatch.
+        use_cache: Whether to use the cached router responses.
+        speculative_delay: Seconds to wait before firing the second attempt.
+
+    Returns:
+        The winning router response.
+    """
+    from agents import router_agent
+
+    primary = asyncio.create_task(router_agent(request, use_cache=use_cache))
+    done, _ = await asyncio.wait({primary}, timeout=speculative_delay)
+    if done:
+        return primary.result()
+
+    logger.info("Primary attempt still running after %.1fs, firing speculative retry", speculative_delay)
+    secondary = asyncio.create_task(router_agent(request, use_cache=use_cache))
+    done, pending = await asyncio.wait(
+        {primary, secondary}, return_when=asyncio.FIRST_COMPLETED
+    )
+    for task in pending:
+        task.cancel()
+    return done.pop().result()
+
+
 async def run_blueprint_generation(
-    language: str, version: str, package_manager: str, max_attempts: int = 3
+    language: str,
+    version: str,
+    package_manager: str,
+    max_attempts: int = 3,
+    use_cache: bool = True,
 ) -> bool:
     """Run the blueprint generation process.
 
@@ -32,10 +81,15 @@ async def run_blueprint_generation(
         version: Version of the technology.
         package_manager: Package manager for the technology.
         max_attempts: Maximum number of attempts to generate and validate the blueprint.
+        use_cache: Whether to use the cached router responses.
 
     Returns:
         True if the blueprint was successfully generated and validated, False otherwise.
     """
+    from pydantic_ai.exceptions import UnexpectedModelBehavior
+
+    from models import AgentAction, RouterRequest, Technology
+
     technology = Technology(language=language, version=version, package_manager=package_manager)
 
     # Start with generation
@@ -44,6 +98,10 @@ async def run_blueprint_generation(
     attempt = 1
 
     while attempt <= max_attempts:
+        if attempt > 1:
+            # Jittered exponential backoff so retries don't stampede the API
+            await asyncio.sleep(random.uniform(0, 2**attempt * BACKOFF_BASE))
+
         logger.info(
             "Attempt %d/%d: %s for %s %s with %s",
             attempt,
@@ -62,8 +120,8 @@ async def run_blueprint_generation(
                 context=context,
             )
 
-            # Process request
-            response = await router_agent(request)
+            # Process request, racing a speculative retry if it stalls
+            response = await _dispatch_with_speculation(request, use_cache)
 
             # Log result
             if response.result.success:
@@ -89,6 +147,36 @@ async def run_blueprint_generation(
     return False
 
 
+async def main_batch(
+    specs: List[Technology], max_parallel: int = 8, use_cache: bool = True
+) -> List[bool]:
+    """Generate blueprints for several technologies concurrently.
+
+    Each spec becomes one router request; requests are dispatched together with
+    asyncio.gather, bounded by a semaphore so the LLM API is not stampeded.
+
+    Args:
+        specs: Technology specifications to generate blueprints for.
+        max_parallel: Maximum number of requests processed concurrently.
+        use_cache: Whether to use the cached router responses.
+
+    Returns:
+        One success flag per spec, in the same order as the input.
+    """
+    from agents import router_agent
+    from models import AgentAction, RouterRequest
+
+    semaphore = asyncio.Semaphore(max_parallel)
+
+    async def process(spec: Technology) -> bool:
+        async with semaphore:
+            request = RouterRequest(action=AgentAction.GENERATE, technology=spec)
+            response = await router_agent(request, use_cache=use_cache)
+            return response.result.success
+
+    return list(await asyncio.gather(*(process(spec) for spec in specs)))
+
+
 def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
     """Parse command-line arguments.
 
@@ -105,6 +193,9 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
     parser.add_argument(
         "--max-attempts", type=int, default=3, help="Maximum number of attempts (default: 3)"
     )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Bypass the cached router responses"
+    )
 
     return parser.parse_args(args)
 
@@ -133,6 +224,7 @@ def main(args: Optional[List[str]] = None) -> int:
             parsed_args.version,
             parsed_args.package_manager,
             parsed_args.max_attempts,
+            use_cache=not parsed_args.no_cache,
         )
     )
 
@@ -3,9 +3,18 @@
 This module defines the data models used throughout the application.
 """
 
-from enum import Enum
-from typing import Optional
-from pydantic import BaseModel
+from dataclasses import dataclass, field
+from enum import StrEnum
+from functools import cached_property
+from pathlib import Path
+from typing import Dict, Optional
+from pydantic import BaseModel, ConfigDict
+
+from config import SETUP_DIR
+
+# Frozen models are hashable, which lets cached helpers key directly on them;
+# the shared config also strips stray whitespace from CLI-provided fields.
+_MODEL_CONFIG = ConfigDict(frozen=True, extra="forbid", str_strip_whitespace=True)
 
 
 class Technology(BaseModel):
@@ -17,12 +26,42 @@ class Technology(BaseModel):
         package_manager: Package manager for the technology.
     """
 
+    model_config = _MODEL_CONFIG
+
     language: str
     version: str
     package_manager: str
 
+    @cached_property
+    def tech_dir(self) -> Path:
+        """Directory holding this technology's blueprint artifacts."""
+        return Path(SETUP_DIR) / f"{self.language}-{self.version}-{self.package_manager}"
+
+    @cached_property
+    def run_sh_path(self) -> Path:
+        """Path to this technology's run.sh file."""
+        return self.tech_dir / "run.sh"
+
+    @cached_property
+    def blueprint_path(self) -> Path:
+        """Path to this technology's blueprint.yml file."""
+        return self.tech_dir / "blueprint.yml"
+
+
+@dataclass
+class TechDeps:
+    """Dependencies carried through an agent run.
+
+    Attributes:
+        technology: Technology specification for the run.
+        cache: Request-scoped memoization store for tool results.
+    """
+
+    technology: Technology
+    cache: Dict[str, str] = field(default_factory=dict)
 
-class BlueprintStatus(str, Enum):
+
+class BlueprintStatus(StrEnum):
     """Status of a blueprint generation or validation process."""
 
     SUCCESS = "success"
@@ -39,12 +78,14 @@ class SuccessfulBlueprint(BaseModel):
         suggestions: Optional suggestions for improvement.
     """
 
+    model_config = _MODEL_CONFIG
+
     success: bool
     message: str
     suggestions: Optional[str] = None
 
 
-class AgentAction(str, Enum):
+class AgentAction(StrEnum):
     """Actions that can be performed by agents."""
 
     GENERATE = "generate"
@@ -61,6 +102,8 @@ class RouterRequest(BaseModel):
         context: Additional context for the action.
     """
 
+    model_config = _MODEL_CONFIG
+
     action: AgentAction
     technology: Technology
     context: Optional[str] = None
@@ -75,6 +118,8 @@ class RouterResponse(BaseModel):
         next_action: Optional next action to perform.
     """
 
+    model_config = _MODEL_CONFIG
+
     status: BlueprintStatus
     result: SuccessfulBlueprint
     next_action: Optional[AgentAction] = None
@@ -5,18 +5,31 @@ This module defines tools used by agents for blueprint generation and validation
 
 from __future__ import annotations as _annotations
 
+import asyncio
+import atexit
+import functools
+import hashlib
 import os
+import sys
+import threading
 from typing import Dict, Any, Optional
 
 import docker
 from pydantic_ai import RunContext
 
-from config import DOCKER_CONFIG, BlueprintConfig
-from models import SuccessfulBlueprint, Technology
+from config import (
+    CACHE_DIR,
+    DOCKER_CONFIG,
+    VALIDATOR_DOCKERFILE_DIR,
+    VALIDATOR_IMAGE,
+    BlueprintConfig,
+)
+from models import SuccessfulBlueprint, TechDeps, Technology
 from utils import (
+    JsonFileCache,
+    create_multi_tar_archive,
     create_tar_archive,
     ensure_directory,
-    json_to_yaml,
     make_executable,
     read_file,
     setup_logger,
@@ -27,6 +40,213 @@ from utils import (
 logger = setup_logger(__name__)
 blueprint_config = BlueprintConfig()
 
+# Container-run outcomes keyed by validator image and script content hash, so
+# a byte-identical script is never executed in Docker twice. The image tag is
+# part of the key so results invalidate when the base image changes.
+_container_validation_cache = JsonFileCache(
+    os.path.join(CACHE_DIR, "blueprint-validations.json")
+)
+
+
+def _validation_cache_key(script_bytes: bytes) -> str:
+    """Return the container validation cache key for script content."""
+    return f"{VALIDATOR_IMAGE}:{hashlib.sha256(script_bytes).hexdigest()}"
+
+# The blueprint shape is static apart from the technology fields, so a
+# preformatted template replaces a dict build plus a yaml.dump per call. The
+# author and version never change at runtime and are baked in at import;
+# only the per-technology fields are interpolated per call.
+_BLUEPRINT_TEMPLATE = (
+    """\
+name: {name}
+version: %s
+description: >-
+  Installs {language} {tech_version} if it is not already present in the
+  runner environment.
+author: %s
+"""
+    % (blueprint_config.version, blueprint_config.author)
+)
+
+
+_DOCKER_CLIENT: Optional[docker.DockerClient] = None
+_DOCKER_CLIENT_LOCK = threading.Lock()
+
+
+def _docker_client() -> docker.DockerClient:
+    """Return the shared Docker client, creating it on first use.
+
+    docker.from_env() parses the environment, negotiates the API version with
+    an HTTP roundtrip, and builds a fresh connection pool on every call; one
+    client serves the whole process. The lock guards against the image
+    prewarm thread racing the first validation.
+
+    Returns:
+        The shared Docker client.
+    """
+    global _DOCKER_CLIENT
+    with _DOCKER_CLIENT_LOCK:
+        if _DOCKER_CLIENT is None:
+            _DOCKER_CLIENT = docker.from_env()
+        return _DOCKER_CLIENT
+
+
+def _ensure_validator_image(client: docker.DockerClient) -> None:
+    """Build the validator image if it is not already present locally.
+
+    The image bakes bash (and CA certificates) into alpine so validations
+    never pay an apk index fetch and install on the critical path.
+
+    Args:
+        client: Docker client used to check for and build the image.
+    """
+    try:
+        client.images.get(VALIDATOR_IMAGE)
+    except docker.errors.ImageNotFound:
+        logger.info("Building validator image %s...", VALIDATOR_IMAGE)
+        client.images.build(
+            path=VALIDATOR_DOCKERFILE_DIR,
+            dockerfile="validator.Dockerfile",
+            tag=VALIDATOR_IMAGE,
+        )
+
+
+def _prewarm_validator_image() -> None:
+    """Make sure the validator image exists before the first validation.
+
+    Runs in a background thread at import so the first validation does not
+    pay for an image build/pull. Failures are logged and left for the first
+    real validation to surface (Docker may simply not be running yet).
+    """
+    try:
+        _ensure_validator_image(_docker_client())
+    except Exception as e:
+        logger.debug("Validator image prewarm skipped: %s", e)
+
+
+threading.Thread(target=_prewarm_validator_image, daemon=True).start()
+
+
+class _ValidatorPool:
+    """Warm validation container shared across validations.
+
+    Creating a container, installing bash, and tearing everything down again
+    dominates validation wall time. The pool lazily starts one detached
+    container, prepares it once, and hands it out to one validation at a time,
+    so N validations pay one container lifecycle instead of N.
+    """
+
+    def __init__(self) -> None:
+        self._container = None
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> str:
+        """Acquire exclusive use of the warm container, starting it if needed.
+
+        A previously started container may have died between validations
+        (e.g. OOM-killed by the memory limit); in that case it is replaced
+        with a fresh one rather than handed out dead.
+
+        Returns:
+            The id of the running validation container.
+        """
+        await self._lock.acquire()
+        try:
+            if self._container is not None and not await asyncio.to_thread(
+                self._is_running, self._container
+            ):
+                logger.warning("Validation container died; starting a new one")
+                self._container = None
+            if self._container is None:
+                # Container startup is all blocking docker-py work
+                self._container = await asyncio.to_thread(self._start_container)
+            return self._container
+        except BaseException:
+            self._lock.release()
+            raise
+
+    def release(self) -> None:
+        """Release the container for the next validation."""
+        self._lock.release()
+
+    @staticmethod
+    def _is_running(container_id: str) -> bool:
+        """Return whether the container still exists and is running."""
+        try:
+            return _docker_client().api.inspect_container(container_id)["State"][
+                "Running"
+            ]
+        except Exception:  # Removed, or the daemon is unreachable
+            return False
+
+    def _start_container(self) -> str:
+        """Start the detached validation container from the prebuilt image.
+
+        Uses the low-level APIClient directly; the high-level Container model
+        adds reload() roundtrips this hot path never needs.
+        """
+        client = _docker_client()
+        _ensure_validator_image(client)
+
+        logger.info("Starting warm validation container...")
+        api = client.api
+        host_config = api.create_host_config(
+            auto_remove=DOCKER_CONFIG["remove"],
+            mem_limit=DOCKER_CONFIG["mem_limit"],
+        )
+        container_id = api.create_container(
+            image=DOCKER_CONFIG["image"],
+            command="sleep infinity",
+            host_config=host_config,
+        )["Id"]
+        api.start(container_id)
+
+        atexit.register(self.shutdown)
+        return container_id
+
+    def shutdown(self) -> None:
+        """Kill the warm container; it is auto-removed by the daemon.
+
+        kill() is used instead of stop() because stop() sends SIGTERM and
+        waits up to 10 seconds for the sleeping shell to exit — pure dead
+        time for a throwaway container.
+        """
+        if self._container is not None:
+            try:
+                _docker_client().api.kill(self._container)
+            except Exception:  # The daemon may already be gone at exit
+                pass
+            self._container = None
+
+
+_validator_pool = _ValidatorPool()
+
+
+def request_cached(func):
+    """Memoize an async tool result in the request-scoped deps cache.
+
+    The agent may ask for the same lookup several times within one reasoning
+    chain; the memo makes every call after the first a dict lookup.
+
+    Args:
+        func: Async tool taking only a RunContext and returning a string.
+
+    Returns:
+        The wrapped tool function.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(ctx: RunContext[TechDeps]) -> str:
+        key = func.__name__
+        cached = ctx.deps.cache.get(key)
+        if cached is not None:
+            return cached
+        result = await func(ctx)
+        ctx.deps.cache[key] = result
+        return result
+
+    return wrapper
+
 
 def system_prompt() -> str:
     """Return the system prompt for the blueprint agent."""
@@ -56,8 +276,11 @@ def instructions() -> str:
 The correctness of technology name, version, and package manager is crucial for success."""
 
 
+@functools.lru_cache(maxsize=1)
 def example_for_run_sh() -> str:
-    """Return an example run.sh script for reference."""
+    """Return an example run.sh script for reference.
+
+    The example is immutable at runtime, so the disk read happens once."""
     try:
         return read_file("examples/run.sh")
     except FileNotFoundError:
@@ -108,7 +331,8 @@ echo "Python 3.11 installed successfully"
 """
 
 
-async def technology_stack(ctx: RunContext[Technology]) -> str:
+@request_cached
+async def technology_stack(ctx: RunContext[TechDeps]) -> str:
     """Get information about the requested technology stack.
 
     Args:
@@ -119,17 +343,17 @@ async def technology_stack(ctx: RunContext[Technology]) -> str:
     """
     logger.info(
         "Checking technology stack: %s version %s with %s",
-        ctx.deps.language,
-        ctx.deps.version,
-        ctx.deps.package_manager,
+        ctx.deps.technology.language,
+        ctx.deps.technology.version,
+        ctx.deps.technology.package_manager,
     )
     return (
-        f"Generate run.sh for {ctx.deps.language} version {ctx.deps.version} "
-        f"and package manager {ctx.deps.package_manager}"
+        f"Generate run.sh for {ctx.deps.technology.language} version {ctx.deps.technology.version} "
+        f"and package manager {ctx.deps.technology.package_manager}"
     )
 
 
-async def create_directory(ctx: RunContext[Technology]) -> str:
+async def create_directory(ctx: RunContext[TechDeps]) -> str:
     """Create a directory for the blueprint.
 
     Args:
@@ -138,11 +362,8 @@ async def create_directory(ctx: RunContext[Technology]) -> str:
     Returns:
         Message indicating directory creation status.
     """
-    tech_dir = blueprint_config.get_tech_dir(
-        ctx.deps.language, ctx.deps.version, ctx.deps.package_manager
-    )
-    ensure_directory("setup")
-    ensure_directory(tech_dir)
+    tech_dir = ctx.deps.technology.tech_dir
+    await asyncio.to_thread(ensure_directory, tech_dir)
 
     logger.info(
         "Created directory: %s",
@@ -151,7 +372,7 @@ async def create_directory(ctx: RunContext[Technology]) -> str:
     return f"Directory created: {tech_dir}"
 
 
-async def generate_blueprint(ctx: RunContext[Technology]) -> str:
+async def generate_blueprint(ctx: RunContext[TechDeps]) -> str:
     """Generate a blueprint.yml file.
 
     Args:
@@ -160,28 +381,19 @@ async def generate_blueprint(ctx: RunContext[Technology]) -> str:
     Returns:
         Message indicating blueprint creation status.
     """
-    tech_dir = blueprint_config.get_tech_dir(
-        ctx.deps.language, ctx.deps.version, ctx.deps.package_manager
-    )
-    blueprint_path = os.path.join(tech_dir, "blueprint.yml")
-
-    content_json = {
-        "name": f"{ctx.deps.language}-{ctx.deps.version}-{ctx.deps.package_manager}",
-        "version": blueprint_config.version,
-        "description": (
-            f"Installs {ctx.deps.language} {ctx.deps.version} if it is not already "
-            "present in the runner environment."
-        ),
-        "author": blueprint_config.author,
-    }
+    blueprint_path = ctx.deps.technology.blueprint_path
 
-    content = await json_to_yaml(content_json)
-    write_file(blueprint_path, content)
+    content = _BLUEPRINT_TEMPLATE.format(
+        name=f"{ctx.deps.technology.language}-{ctx.deps.technology.version}-{ctx.deps.technology.package_manager}",
+        language=ctx.deps.technology.language,
+        tech_version=ctx.deps.technology.version,
+    )
+    await write_file(blueprint_path, content)
 
     return f"Created blueprint at {blueprint_path}"
 
 
-async def generate_run_sh(ctx: RunContext[Technology], run_file: str) -> SuccessfulBlueprint:
+async def generate_run_sh(ctx: RunContext[TechDeps], run_file: str) -> SuccessfulBlueprint:
     """Generate and validate a run.sh file.
 
     Args:
@@ -191,92 +403,64 @@ async def generate_run_sh(ctx: RunContext[Technology], run_file: str) -> Success
     Returns:
         SuccessfulBlueprint indicating success or failure.
     """
-    tech_dir = blueprint_config.get_tech_dir(
-        ctx.deps.language, ctx.deps.version, ctx.deps.package_manager
-    )
-    run_file_path = os.path.join(tech_dir, "run.sh")
+    run_file_path = ctx.deps.technology.run_sh_path
 
     # Create directory if it doesn't exist
-    ensure_directory(tech_dir)
+    await asyncio.to_thread(ensure_directory, ctx.deps.technology.tech_dir)
 
     try:
-        # Write the run.sh file
-        write_file(run_file_path, run_file)
-
-        # Make the script executable
-        make_executable(run_file_path)
-
-        # Validate the script
-        validation_result = await validate_run_sh(run_file_path)
-
-        return SuccessfulBlueprint(success=True, message=validation_result)
+        script_bytes = run_file.encode()
+
+        async def _persist() -> None:
+            await write_file(run_file_path, run_file)
+            # chmod must follow the write; both stay off the event loop and
+            # overlap the (much slower) container validation
+            await asyncio.to_thread(make_executable, run_file_path)
+
+        # A byte-identical script that already validated never re-runs the
+        # container; the script is still persisted for downstream consumers
+        cache_key = _validation_cache_key(script_bytes)
+        cached = _container_validation_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Container validation cache hit for %s", run_file_path)
+            await _persist()
+            ctx.deps.cache.pop("show_invalid_run_sh", None)
+            return SuccessfulBlueprint.model_validate_json(cached)
+
+        # Persist the script and validate the in-memory copy concurrently;
+        # validation no longer round-trips through the filesystem
+        _, validation_result = await asyncio.gather(
+            _persist(), validate_run_sh(script_bytes)
+        )
+
+        # The memoized copy of the previous script is stale now
+        ctx.deps.cache.pop("show_invalid_run_sh", None)
+
+        result = SuccessfulBlueprint(success=True, message=validation_result)
+        _container_validation_cache.set(cache_key, result.model_dump_json())
+        return result
     except (OSError, ValueError) as e:
         return SuccessfulBlueprint(success=False, message=str(e))
 
 
-async def validate_run_sh(run_file_path: str) -> str:
-    """Validate a run.sh file by executing it in a Docker container.
+async def validate_run_sh(script_bytes: bytes) -> str:
+    """Validate run.sh content by executing it in a Docker container.
 
     Args:
-        run_file_path: Path to the run.sh file.
+        script_bytes: Content of the run.sh script.
 
     Returns:
         Validation result message.
     """
     try:
-        client = docker.from_env()
-        script_path = os.path.abspath(run_file_path)
-
-        if not os.path.exists(script_path):
-            return f"Run script not found at: {script_path}"
-
-        logger.info("Creating Alpine container for validation...")
-
-        # Create and start container
-        container = client.containers.run(**DOCKER_CONFIG)
+        container_id = await _validator_pool.acquire()
 
         try:
-            # Copy the run.sh file to container
-            logger.info("Copying run.sh to container...")
-            tar_buffer = create_tar_archive(script_path)
-            container.put_archive("/tmp/", tar_buffer.getvalue())
-
-            # Make script executable
-            container.exec_run(["chmod", "+x", "/tmp/run.sh"])
-
-            # Install bash
-            logger.info("Installing bash...")
-            install_result = container.exec_run(["apk", "add", "--no-cache", "bash"])
-            if install_result.exit_code != 0:
-                error_output = install_result.output.decode("utf-8")
-                raise ValueError(
-                    f"Failed to install bash. Exit code: {install_result.exit_code}, "
-                    f"Output: {error_output}"
-                )
-
-            # Execute the script
-            logger.info("Executing run.sh script with live logs...")
-            exec_id = container.client.api.exec_create(
-                container.id,
-                cmd=["/bin/bash", "/tmp/run.sh"],
-                stdout=True,
-                stderr=True,
-            )["Id"]
-
-            # Stream output in real-time
-            stream = container.client.api.exec_start(exec_id, stream=True)
-            logs = []
-            for chunk in stream:
-                decoded_line = chunk.decode("utf-8").strip()
-                logger.info(decoded_line)
-                logs.append(decoded_line)
-
-            # Get exit code after streaming completes
-            exit_code = container.client.api.exec_inspect(exec_id)["ExitCode"]
-            logger.info("Script exited with code: %s", exit_code)
-
-            # Keep only last 500 characters for error reporting
-            last_logs = "\n".join(logs)[-500:]
+            # docker-py is synchronous; run the copy/exec/stream sequence in a
+            # worker thread so concurrent validations don't stall the loop
+            exit_code, last_logs = await asyncio.to_thread(
+                _run_script_in_container, container_id, script_bytes
+            )
 
             if exit_code == 0:
                 return f"Validation successful. Exit code: {exit_code}"
@@ -288,12 +472,163 @@ async def validate_run_sh(run_file_path: str) -> str:
             raise ValueError(error_msg % (exit_code, last_logs))
 
         finally:
-            container.stop()
+            try:
+                # Reset the container state for the next validation
+                await asyncio.to_thread(
+                    _exec_quiet, container_id, ["rm", "-f", "/tmp/run.sh"]
+                )
+            finally:
+                # Release unconditionally; a failed cleanup must not leave
+                # the pool lock held forever
+                _validator_pool.release()
     except Exception as e:
         raise ValueError(f"Validation failed: {str(e)}") from e
 
 
-async def show_invalid_run_sh(ctx: RunContext[Technology]) -> str:
+def _put_archive(container_id: str, data: bytes) -> None:
+    """Copy a tar archive into the container's /tmp directory."""
+    _docker_client().api.put_archive(container_id, "/tmp/", data)
+
+
+def _exec_quiet(container_id: str, cmd: list[str]) -> None:
+    """Run a housekeeping command in the container, discarding its output."""
+    api = _docker_client().api
+    exec_id = api.exec_create(container_id, cmd=cmd)["Id"]
+    api.exec_start(exec_id)
+
+
+def _run_script_in_container(container_id: str, script_bytes: bytes) -> tuple[int, str]:
+    """Copy a script into the container, execute it, and stream its logs.
+
+    This performs blocking docker-py calls and is meant to be run through
+    asyncio.to_thread.
+
+    Args:
+        container_id: Id of the running container to execute the script in.
+        script_bytes: Content of the run.sh script.
+
+    Returns:
+        Tuple of the exit code and the tail of the captured logs.
+    """
+    # Copy the run.sh file to container; the tar entry is already marked
+    # executable, so no chmod exec is needed
+    logger.info("Copying run.sh to container...")
+    _put_archive(container_id, create_tar_archive(script_bytes))
+
+    return _exec_script(container_id, "/tmp/run.sh")
+
+
+def _exec_script(container_id: str, script_path: str) -> tuple[int, str]:
+    """Execute a script already present in the container and stream its logs.
+
+    This performs blocking docker-py calls and is meant to be run through
+    asyncio.to_thread.
+
+    Args:
+        container_id: Id of the running container to execute the script in.
+        script_path: Path of the script inside the container.
+
+    Returns:
+        Tuple of the exit code and the tail of the captured logs.
+    """
+    api = _docker_client().api
+    logger.info("Executing %s with live logs...", script_path)
+    exec_id = api.exec_create(
+        container_id,
+        cmd=["/bin/bash", script_path],
+        stdout=True,
+        stderr=True,
+    )["Id"]
+
+    # Stream output in real-time, writing raw bytes straight to stdout (where
+    # the log handler points anyway) instead of decoding and formatting a log
+    # record per chunk. Only a bounded byte tail is kept for error reporting,
+    # decoded once at the end, so memory stays O(1) however chatty the script.
+    stream = api.exec_start(exec_id, stream=True)
+    stdout = sys.stdout.buffer
+    tail = bytearray()
+    for chunk in stream:
+        stdout.write(chunk)
+        stdout.flush()
+        tail.extend(chunk)
+        del tail[:-1024]
+
+    # Get exit code after streaming completes
+    exit_code = api.exec_inspect(exec_id)["ExitCode"]
+    logger.info("Script exited with code: %s", exit_code)
+
+    # Keep only last 500 characters for error reporting
+    return exit_code, tail.decode("utf-8", errors="replace")[-500:]
+
+
+async def generate_run_sh_batch(
+    items: list[tuple[Technology, str]],
+) -> list[SuccessfulBlueprint]:
+    """Generate and validate several run.sh files in one warm container.
+
+    All scripts are copied in with a single put_archive and executed
+    concurrently, so the batch pays one container lifecycle instead of one
+    per script. Each script is also persisted to its technology directory.
+
+    Args:
+        items: Pairs of technology and run.sh content.
+
+    Returns:
+        One SuccessfulBlueprint per item, in input order.
+    """
+    if not items:
+        return []
+
+    async def persist(technology: Technology, run_file: str) -> None:
+        await asyncio.to_thread(ensure_directory, technology.tech_dir)
+        await write_file(technology.run_sh_path, run_file)
+        await asyncio.to_thread(make_executable, technology.run_sh_path)
+
+    async def run_one(index: int) -> SuccessfulBlueprint:
+        exit_code, last_logs = await asyncio.to_thread(
+            _exec_script, container_id, f"/tmp/run_{index}.sh"
+        )
+        if exit_code == 0:
+            return SuccessfulBlueprint(
+                success=True, message=f"Validation successful. Exit code: {exit_code}"
+            )
+        return SuccessfulBlueprint(
+            success=False,
+            message=(
+                f"Validation failed. The script exited with code {exit_code}. "
+                f"Check the logs for details. Last logs: {last_logs}"
+            ),
+        )
+
+    scripts = [run_file.encode() for _, run_file in items]
+
+    container_id = await _validator_pool.acquire()
+    try:
+        files = {f"run_{i}.sh": script for i, script in enumerate(scripts)}
+        await asyncio.to_thread(
+            _put_archive, container_id, create_multi_tar_archive(files)
+        )
+
+        results = await asyncio.gather(
+            *(run_one(i) for i in range(len(items))),
+            *(persist(technology, run_file) for technology, run_file in items),
+        )
+    finally:
+        try:
+            # Reset the container state for the next validation
+            await asyncio.to_thread(
+                _exec_quiet, container_id, ["sh", "-c", "rm -f /tmp/run_*.sh"]
+            )
+        finally:
+            # Release unconditionally; a failed cleanup must not leave the
+            # pool lock held forever
+            _validator_pool.release()
+
+    return list(results[: len(items)])
+
+
+@request_cached
+async def show_invalid_run_sh(ctx: RunContext[TechDeps]) -> str:
     """Show the invalid run.sh file that needs to be reconfigured.
 
     Args:
@@ -302,11 +637,9 @@ async def show_invalid_run_sh(ctx: RunContext[Technology]) -> str:
     Returns:
         Content of the run.sh file.
     """
-    run_file_path = blueprint_config.get_run_sh_path(
-        ctx.deps.language, ctx.deps.version, ctx.deps.package_manager
-    )
+    run_file_path = ctx.deps.technology.run_sh_path
 
     try:
-        return read_file(run_file_path)
+        return await asyncio.to_thread(read_file, run_file_path)
     except FileNotFoundError:
         return "Run.sh file not found. It may not have been generated yet."